@@ -6,18 +6,30 @@ and sends notifications when units become available.
 """
 
 import os
+import re
+import json
+import hashlib
 import sys
+import asyncio
 import time
+import atexit
+import queue
 import logging
+import logging.handlers
 import smtplib
+import contextlib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
 
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html as lxml_html
 
 # Optional Selenium for sites that block requests
 try:
@@ -36,6 +48,21 @@ except ImportError:
     TWILIO_AVAILABLE = False
     print("Twilio not installed. SMS notifications disabled.")
 
+# Optional aiohttp + aiosmtplib for the asyncio pipeline
+try:
+    import aiohttp
+    import aiosmtplib
+    ASYNC_AVAILABLE = True
+except ImportError:
+    ASYNC_AVAILABLE = False
+
+# Optional brotli so the server can send br-compressed pages
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
 # Optional dotenv for environment variables
 try:
     from dotenv import load_dotenv
@@ -43,26 +70,131 @@ try:
 except ImportError:
     pass
 
-# Configure logging
+# Configure logging: records go onto a queue and a background listener
+# does the stdout/file writes, keeping disk I/O off the monitoring path
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(
+    log_queue,
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler('aro_monitor.log', mode='a')
+)
+log_listener.start()
+atexit.register(log_listener.stop)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('aro_monitor.log', mode='a')
-    ]
+    format='%(asctime)s.%(msecs)03d - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S',
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
 logger = logging.getLogger(__name__)
 
+# HTTP validators (ETag / Last-Modified) are persisted here between runs
+CACHE_FILE = os.path.expanduser('~/.aro_monitor_cache.json')
+
+# Hash of the last-notified unit set, used to avoid repeat notifications
+STATE_FILE = os.path.expanduser('~/.aro_monitor_state')
+
+# Minimum time between notifications, even when the unit set changes
+RENOTIFY_INTERVAL = 6 * 60 * 60
+
+# Notification email body; EMAIL_UNIT_LINE is repeated once per unit
+EMAIL_TEMPLATE = """Good news! ARO one-bedroom units are available at Lincoln Commons:
+
+{units}
+
+Check the website: {url}
+
+Time checked: {ts}
+
+This is an automated message from Lincoln Commons ARO Monitor."""
+EMAIL_UNIT_LINE = "• {type}: {text}..."
+
+# Hard cap on the decoded page size, read in CHUNK_SIZE pieces
+MAX_RESPONSE_BYTES = 4 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+class NotModified:
+    """Type of NOT_MODIFIED, returned by the fetchers on HTTP 304."""
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'NOT_MODIFIED'
+
+
+NOT_MODIFIED = NotModified()
+
+# Parser for text that was already decoded, e.g. Selenium's page_source
+_UTF8_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+# Listing containers: div/article/section whose class mentions a listing term,
+# compiled once and evaluated by lxml in C
+_LOWER_CLASS = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+_LISTING_XPATH = etree.XPath(
+    "//*[self::div or self::article or self::section][" +
+    " or ".join(f"contains({_LOWER_CLASS}, '{term}')"
+                for term in ('apartment', 'unit', 'floorplan', 'listing')) +
+    "]"
+)
+
+
+def _is_element_list(result) -> bool:
+    """Return True if an XPath result is a list of HTML elements."""
+    return isinstance(result, list) and all(isinstance(item, lxml_html.HtmlElement) for item in result)
+
+
+def compile_listing_xpath(expression: str) -> etree.XPath:
+    """Compile a site-specific listing XPath, raising ValueError on a syntax error.
+
+    Once the page's listing-card markup is known (e.g. //div[@data-floorplan-type]),
+    setting ARO_LISTING_XPATH lets the parser look up exactly those cards
+    instead of testing the class of every div/article/section.
+    """
+    try:
+        return etree.XPath(expression)
+    except etree.XPathError as e:
+        raise ValueError(f"Invalid ARO_LISTING_XPATH {expression!r}: {e}") from e
+
+
+# Case-insensitive patterns used to classify a listing's text
+_ARO_RE = re.compile(r'\baro\b', re.I)
+_BED_RE = re.compile(r'(1|one)\s*bed', re.I)
+_AVAIL_RE = re.compile(r'available|now', re.I)
+
+@dataclass(slots=True)
+class AroUnit:
+    """An ARO one-bedroom listing found on the floorplans page."""
+    type: str
+    available: bool
+    text: str
+    timestamp: str
+
+
 class LincolnCommonsMonitor:
     """Monitor Lincoln Commons website for ARO unit availability."""
+
+    __slots__ = (
+        'base_url', 'session',
+        'email_address', 'email_password', 'notification_email',
+        'twilio_client', 'twilio_phone', 'notification_phone',
+        '_email_ready', '_sms_ready', '_listing_xpath',
+        '_etag', '_last_modified', '_validators_pending', '_aiohttp', '_smtp'
+    )
     
     def __init__(self):
         self.base_url = "https://www.lincolncommonapartments.com/floorplans"
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Connection': 'keep-alive',
+            'Accept-Encoding': ACCEPT_ENCODING
         })
+        # Keep-alive pool with retries so repeated polls reuse the TLS connection
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
         
         # Email configuration
         self.email_address = os.getenv('EMAIL_ADDRESS')
@@ -71,6 +203,8 @@ class LincolnCommonsMonitor:
         
         # SMS configuration (optional)
         self.twilio_client = None
+        self.twilio_phone = None
+        self.notification_phone = None
         if TWILIO_AVAILABLE:
             account_sid = os.getenv('TWILIO_ACCOUNT_SID')
             auth_token = os.getenv('TWILIO_AUTH_TOKEN')
@@ -80,7 +214,68 @@ class LincolnCommonsMonitor:
             if account_sid and auth_token:
                 self.twilio_client = Client(account_sid, auth_token)
 
-    def fetch_floorplans(self) -> Optional[str]:
+        # Which notification channels are fully configured
+        self._email_ready = all([self.email_address, self.email_password, self.notification_email])
+        self._sms_ready = bool(self.twilio_client and self.twilio_phone and self.notification_phone)
+
+        # Listing selector: ARO_LISTING_XPATH if set, else the generic class scan
+        listing_expression = os.getenv('ARO_LISTING_XPATH')
+        self._listing_xpath = compile_listing_xpath(listing_expression) if listing_expression else _LISTING_XPATH
+
+        # Conditional-request validators from the last 200 response. They stay
+        # pending (unsaved and unsent) until that page has been fully handled.
+        self._etag = None
+        self._last_modified = None
+        self._validators_pending = False
+        self._load_cache()
+
+        # aiohttp session for the async pipeline, created lazily inside the event loop
+        self._aiohttp = None
+
+        # SMTP connection kept open between notifications, created lazily
+        self._smtp = None
+        atexit.register(self._close_smtp)
+
+    def _load_cache(self):
+        """Load the ETag/Last-Modified validators saved by a previous run."""
+        try:
+            with open(CACHE_FILE) as f:
+                cache = json.load(f)
+            self._etag = cache.get('etag')
+            self._last_modified = cache.get('last_modified')
+        except (OSError, ValueError):
+            pass
+
+    def _remember_validators(self, headers):
+        """Hold the validators from a 200 response until the poll has finished with it."""
+        self._etag = headers.get('ETag')
+        self._last_modified = headers.get('Last-Modified')
+        self._validators_pending = True
+
+    def _save_cache(self):
+        """Save pending validators to disk once their page needs no further work."""
+        if not self._validators_pending:
+            return
+        self._validators_pending = False
+        try:
+            with open(CACHE_FILE, 'w') as f:
+                json.dump({'etag': self._etag, 'last_modified': self._last_modified}, f)
+        except OSError as e:
+            logger.warning(f"Could not write {CACHE_FILE}: {e}")
+
+    def _conditional_headers(self) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from the cached validators."""
+        headers = {}
+        # The last page still needs handling, so a 304 must not let it be skipped
+        if self._validators_pending:
+            return headers
+        if self._etag:
+            headers['If-None-Match'] = self._etag
+        if self._last_modified:
+            headers['If-Modified-Since'] = self._last_modified
+        return headers
+
+    def fetch_floorplans(self) -> Optional[Union[str, bytes, NotModified]]:
         """Fetch the floorplans page content using Selenium if available, else requests."""
         if SELENIUM_AVAILABLE:
             try:
@@ -101,40 +296,61 @@ class LincolnCommonsMonitor:
                 # If Selenium fails, fall back to requests
         try:
             logger.info(f"Fetching floorplans from {self.base_url} using requests")
-            response = self.session.get(self.base_url, timeout=30)
-            response.raise_for_status()
-            return response.text
-        except requests.exceptions.RequestException as e:
+            # Stream the body so an oversized page is rejected before it is fully buffered
+            with self.session.get(self.base_url, headers=self._conditional_headers(),
+                                  timeout=30, stream=True) as response:
+                if response.status_code == 304:
+                    logger.info("Floorplans page not modified since last check")
+                    return NOT_MODIFIED
+                response.raise_for_status()
+                body = bytearray()
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    body.extend(chunk)
+                    if len(body) > MAX_RESPONSE_BYTES:
+                        raise ValueError(f"response larger than {MAX_RESPONSE_BYTES} bytes")
+                self._remember_validators(response.headers)
+            # Raw bytes let lxml detect the encoding itself and skip requests' charset guessing
+            return bytes(body)
+        except (requests.exceptions.RequestException, ValueError) as e:
             logger.error(f"Error fetching floorplans: {e}")
             return None
 
-    def parse_aro_units(self, html_content: str) -> List[Dict]:
-        """Parse HTML content to find ARO one-bedroom units."""
-        soup = BeautifulSoup(html_content, 'html.parser')
+    def parse_aro_units(self, html_content: Union[str, bytes]) -> Optional[List[AroUnit]]:
+        """Parse HTML content to find ARO one-bedroom units; None if parsing failed."""
         aro_units = []
+        # Every unit found in this pass was seen at the same poll instant
+        seen_at = datetime.now().isoformat()
         
         try:
-            # Look for apartment listings
-            # This is a placeholder - actual selectors would need to be determined
-            # by inspecting the Lincoln Commons website structure
+            if isinstance(html_content, str):
+                # Selenium returns decoded text; lxml rejects str with an encoding
+                # declaration, so re-encode and pin the parser to that encoding
+                root = lxml_html.fromstring(html_content.encode('utf-8'), parser=_UTF8_PARSER)
+            else:
+                # lxml reads the encoding from the byte stream itself
+                root = lxml_html.fromstring(html_content)
             
-            # Common patterns for apartment listing sites:
-            listings = soup.find_all(['div', 'article', 'section'], 
-                                   class_=lambda x: x and any(term in x.lower() for term in 
-                                                            ['apartment', 'unit', 'floorplan', 'listing']))
+            # Look for apartment listings
+            # The generic scan is a placeholder until the Lincoln Commons listing
+            # markup is pinned down; ARO_LISTING_XPATH selects it directly
+            listings = self._listing_xpath(root)
+            if not _is_element_list(listings):
+                logger.error("Error parsing ARO units: ARO_LISTING_XPATH must select elements")
+                return None
             
             for listing in listings:
                 # Look for ARO and one-bedroom indicators
-                text_content = listing.get_text().lower()
+                # Join text nodes with spaces so adjacent elements don't run together
+                raw_text = ' '.join(' '.join(listing.itertext()).split())
                 
-                if 'aro' in text_content and ('1 bed' in text_content or 'one bed' in text_content):
+                if _ARO_RE.search(raw_text) and _BED_RE.search(raw_text):
                     # Extract unit details
-                    unit_info = {
-                        'type': 'ARO One-Bedroom',
-                        'available': 'available' in text_content or 'now' in text_content,
-                        'text': listing.get_text().strip()[:200],  # First 200 chars
-                        'timestamp': datetime.now().isoformat()
-                    }
+                    unit_info = AroUnit(
+                        type='ARO One-Bedroom',
+                        available=bool(_AVAIL_RE.search(raw_text)),
+                        text=raw_text[:200],  # First 200 chars
+                        timestamp=seen_at
+                    )
                     aro_units.append(unit_info)
                     
             logger.info(f"Found {len(aro_units)} ARO one-bedroom units")
@@ -142,40 +358,67 @@ class LincolnCommonsMonitor:
             
         except Exception as e:
             logger.error(f"Error parsing ARO units: {e}")
-            return []
+            return None
 
-    def send_email_notification(self, units: List[Dict]) -> bool:
-        """Send email notification about available units."""
-        if not all([self.email_address, self.email_password, self.notification_email]):
-            logger.warning("Email configuration incomplete. Skipping email notification.")
-            return False
+    def _build_email(self, units: List[AroUnit]) -> MIMEMultipart:
+        """Build the notification email for the given units."""
+        now = datetime.now()
+        msg = MIMEMultipart()
+        msg['From'] = self.email_address
+        msg['To'] = self.notification_email
+        msg['Subject'] = f"🏠 ARO Units Available at Lincoln Commons - {now.strftime('%Y-%m-%d %H:%M')}"
+        
+        body = EMAIL_TEMPLATE.format(
+            units='\n'.join(EMAIL_UNIT_LINE.format(type=unit.type, text=unit.text[:100]) for unit in units),
+            url=self.base_url,
+            ts=now.strftime('%Y-%m-%d %H:%M:%S')
+        )
+        
+        msg.attach(MIMEText(body, 'plain'))
+        return msg
+
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Return a live Gmail SMTP connection, reconnecting if the cached one has dropped."""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._smtp.close()
+            self._smtp = None
             
+        # Connect to Gmail SMTP
+        server = smtplib.SMTP('smtp.gmail.com', 587)
         try:
-            msg = MIMEMultipart()
-            msg['From'] = self.email_address
-            msg['To'] = self.notification_email
-            msg['Subject'] = f"🏠 ARO Units Available at Lincoln Commons - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-            
-            body = f"""
-Good news! ARO one-bedroom units are available at Lincoln Commons:
-
-{chr(10).join([f"• {unit['type']}: {unit['text'][:100]}..." for unit in units])}
-
-Check the website: {self.base_url}
+            server.starttls()
+            server.login(self.email_address, self.email_password)
+        except BaseException:
+            # Don't leak the socket when TLS or authentication fails
+            server.close()
+            raise
+        self._smtp = server
+        return server
 
-Time checked: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+    def _close_smtp(self):
+        """Close the cached SMTP connection, if any."""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._smtp = None
 
-This is an automated message from Lincoln Commons ARO Monitor.
-            """.strip()
+    def send_email_notification(self, units: List[AroUnit]) -> bool:
+        """Send email notification about available units."""
+        if not self._email_ready:
+            logger.warning("Email configuration incomplete. Skipping email notification.")
+            return False
             
-            msg.attach(MIMEText(body, 'plain'))
+        try:
+            msg = self._build_email(units)
             
-            # Connect to Gmail SMTP
-            server = smtplib.SMTP('smtp.gmail.com', 587)
-            server.starttls()
-            server.login(self.email_address, self.email_password)
-            server.send_message(msg)
-            server.quit()
+            self._get_smtp().send_message(msg)
             
             logger.info(f"Email notification sent to {self.notification_email}")
             return True
@@ -184,9 +427,9 @@ This is an automated message from Lincoln Commons ARO Monitor.
             logger.error(f"Error sending email notification: {e}")
             return False
 
-    def send_sms_notification(self, units: List[Dict]) -> bool:
+    def send_sms_notification(self, units: List[AroUnit]) -> bool:
         """Send SMS notification about available units."""
-        if not self.twilio_client or not self.twilio_phone or not self.notification_phone:
+        if not self._sms_ready:
             logger.warning("SMS configuration incomplete. Skipping SMS notification.")
             return False
             
@@ -206,48 +449,260 @@ This is an automated message from Lincoln Commons ARO Monitor.
             logger.error(f"Error sending SMS notification: {e}")
             return False
 
+    def _can_notify(self) -> bool:
+        """Return False if no channel is configured and log-only mode is not allowed."""
+        if self._email_ready or self._sms_ready:
+            return True
+        if os.getenv('ARO_ALLOW_LOG_ONLY', '').lower() in ('1', 'true', 'yes'):
+            logger.info("No notification channel configured. Running in log-only mode.")
+            return True
+        logger.warning("No notification channel configured. Set ARO_ALLOW_LOG_ONLY=1 to check anyway. Skipping check.")
+        return False
+
+    def _units_hash(self, units: List[AroUnit]) -> str:
+        """Return a stable hash of the given units' text."""
+        return hashlib.blake2b(
+            json.dumps(sorted(unit.text for unit in units)).encode(), digest_size=16
+        ).hexdigest()
+
+    def _load_notification_state(self) -> Dict:
+        """Load the last-notified hash and time, or an empty state."""
+        try:
+            with open(STATE_FILE) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_notification_state(self, state_hash: Optional[str], notified_at: float):
+        """Record the last-notified unit hash and when that notification went out."""
+        try:
+            with open(STATE_FILE, 'w') as f:
+                json.dump({'hash': state_hash, 'last_notified_at': notified_at}, f)
+        except OSError as e:
+            logger.warning(f"Could not write {STATE_FILE}: {e}")
+
+    @staticmethod
+    def _is_new_page(html_content: Optional[Union[str, bytes, NotModified]]) -> bool:
+        """Return True if a fetch produced a page that still needs parsing."""
+        # An unchanged page (304) has nothing new to parse or notify about
+        return html_content is not NOT_MODIFIED and bool(html_content)
+
+    @contextlib.contextmanager
+    def _poll_guard(self):
+        """Log and swallow errors from one poll so a long-running poller keeps going."""
+        try:
+            yield
+        except Exception as e:
+            logger.exception(f"Error during monitoring: {e}")
+
     def monitor(self) -> bool:
         """Main monitoring function."""
         logger.info("Starting Lincoln Commons ARO monitoring check")
+        if not self._can_notify():
+            return False
         
         # Fetch page content
         html_content = self.fetch_floorplans()
-        if not html_content:
+        if not self._is_new_page(html_content):
             return False
             
-        # Parse for ARO units
+        available, units, state_hash = self._check_page(html_content)
+        if units:
+            self._record_notification(state_hash, self._notify_parallel(units))
+        return available
+
+    def _notify_parallel(self, units: List[AroUnit]) -> bool:
+        """Send email and SMS in parallel threads; True if either was sent."""
+        # Email and SMS are independent I/O, so run them in parallel
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                executor.submit(self.send_email_notification, units): 'email',
+                executor.submit(self.send_sms_notification, units): 'sms'
+            }
+            results = {futures[future]: future.result() for future in as_completed(futures)}
+        return results['email'] or results['sms']
+
+    def _check_page(self, html_content: Union[str, bytes]
+                    ) -> Tuple[bool, Optional[List[AroUnit]], Optional[str]]:
+        """Parse a fetched page and decide whether a notification is due.
+
+        Returns (units available, units to notify about, their state hash);
+        the last two are None when nothing should be sent.
+        """
+        # Parse for ARO units; on failure keep the validators pending so the page is retried
         aro_units = self.parse_aro_units(html_content)
+        if aro_units is None:
+            return False, None, None
         
         # Check for available units
-        available_units = [unit for unit in aro_units if unit.get('available', False)]
+        available_units = [unit for unit in aro_units if unit.available]
         
         if available_units:
             logger.info(f"🎉 Found {len(available_units)} available ARO one-bedroom units!")
             
-            # Send notifications
-            email_sent = self.send_email_notification(available_units)
-            sms_sent = self.send_sms_notification(available_units)
-            
-            if email_sent or sms_sent:
-                logger.info("Notifications sent successfully")
-            else:
-                logger.warning("Failed to send notifications")
+            state = self._load_notification_state()
+            state_hash = self._units_hash(available_units)
+            if state_hash == state.get('hash'):
+                logger.info("Available units unchanged since last notification. Skipping notifications.")
+                self._save_cache()
+                return True, None, None
+            if time.time() - state.get('last_notified_at', 0) < RENOTIFY_INTERVAL:
+                # Leave the validators pending so later polls re-check this page
+                # instead of getting a 304, and notify once the interval has passed
+                logger.info("Last notification was sent too recently. Notification deferred.")
+                return True, None, None
                 
-            return True
+            return True, available_units, state_hash
         else:
             logger.info("No available ARO one-bedroom units found")
+            # Forget the last-notified set so the same units are announced if they return
+            state = self._load_notification_state()
+            if state.get('hash'):
+                self._save_notification_state(None, state.get('last_notified_at', 0))
+            self._save_cache()
+            return False, None, None
+
+    def _record_notification(self, state_hash: str, sent: bool):
+        """Save notification state and validators once a notification went out."""
+        if sent:
+            self._save_notification_state(state_hash, time.time())
+            self._save_cache()
+            logger.info("Notifications sent successfully")
+        else:
+            logger.warning("Failed to send notifications")
+
+    async def _get_aiohttp(self) -> 'aiohttp.ClientSession':
+        """Return the shared aiohttp session, creating it on first use."""
+        if self._aiohttp is None or self._aiohttp.closed:
+            self._aiohttp = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=75),
+                headers=dict(self.session.headers)
+            )
+        return self._aiohttp
+
+    async def fetch_floorplans_async(self) -> Optional[Union[bytes, NotModified]]:
+        """Fetch the floorplans page content using aiohttp."""
+        try:
+            logger.info(f"Fetching floorplans from {self.base_url} using aiohttp")
+            session = await self._get_aiohttp()
+            async with session.get(self.base_url, headers=self._conditional_headers(),
+                                   timeout=aiohttp.ClientTimeout(total=30)) as response:
+                if response.status == 304:
+                    logger.info("Floorplans page not modified since last check")
+                    return NOT_MODIFIED
+                response.raise_for_status()
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    body.extend(chunk)
+                    if len(body) > MAX_RESPONSE_BYTES:
+                        raise ValueError(f"response larger than {MAX_RESPONSE_BYTES} bytes")
+                self._remember_validators(response.headers)
+                return bytes(body)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.error(f"Error fetching floorplans: {e}")
+            return None
+
+    async def send_email_notification_async(self, units: List[AroUnit]) -> bool:
+        """Send email notification about available units using aiosmtplib."""
+        if not self._email_ready:
+            logger.warning("Email configuration incomplete. Skipping email notification.")
             return False
+            
+        try:
+            await aiosmtplib.send(
+                self._build_email(units),
+                hostname='smtp.gmail.com',
+                port=587,
+                start_tls=True,
+                username=self.email_address,
+                password=self.email_password
+            )
+            logger.info(f"Email notification sent to {self.notification_email}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error sending email notification: {e}")
+            return False
+
+    async def monitor_async(self) -> bool:
+        """Async monitoring function; email and SMS are sent concurrently."""
+        logger.info("Starting Lincoln Commons ARO monitoring check (async)")
+        if not self._can_notify():
+            return False
+        
+        html_content = await self.fetch_floorplans_async()
+        if not self._is_new_page(html_content):
+            return False
+            
+        available, units, state_hash = self._check_page(html_content)
+        if units:
+            self._record_notification(state_hash, await self._notify_async(units))
+        return available
+
+    async def _notify_async(self, units: List[AroUnit]) -> bool:
+        """Send email and SMS concurrently; True if either was sent."""
+        # Twilio's client is blocking, so run it in a worker thread
+        email_sent, sms_sent = await asyncio.gather(
+            self.send_email_notification_async(units),
+            asyncio.to_thread(self.send_sms_notification, units)
+        )
+        return email_sent or sms_sent
+
+    async def run_async(self, interval: int = 0) -> bool:
+        """Run one async check, or poll every `interval` seconds if it is positive."""
+        try:
+            if interval <= 0:
+                return await self.monitor_async()
+            logger.info(f"Polling every {interval} seconds")
+            while True:
+                with self._poll_guard():
+                    success = await self.monitor_async()
+                    logger.info(f"Monitoring completed. Success: {success}")
+                await asyncio.sleep(interval)
+        finally:
+            if self._aiohttp is not None:
+                await self._aiohttp.close()
+
+    def run_forever(self, interval: int):
+        """Poll every `interval` seconds, reusing the same session between checks."""
+        logger.info(f"Polling every {interval} seconds")
+        while True:
+            with self._poll_guard():
+                success = self.monitor()
+                logger.info(f"Monitoring completed. Success: {success}")
+            time.sleep(interval)
 
 
 def main():
     """Main entry point."""
     logger.info("=== Lincoln Commons ARO Monitor Started ===")
     
-    monitor = LincolnCommonsMonitor()
+    # Set ARO_POLL_INTERVAL (seconds) to keep polling in-process instead of a single run
+    poll_interval_setting = os.getenv('ARO_POLL_INTERVAL', '0')
+    try:
+        poll_interval = int(poll_interval_setting)
+        if poll_interval < 0:
+            raise ValueError
+    except ValueError:
+        logger.error(f"ARO_POLL_INTERVAL must be a non-negative number of seconds, got {poll_interval_setting!r}")
+        sys.exit(1)
+    
+    # Set ARO_ASYNC=1 to use the aiohttp/aiosmtplib pipeline (requires both packages)
+    use_async = os.getenv('ARO_ASYNC', '').lower() in ('1', 'true', 'yes')
+    if use_async and not ASYNC_AVAILABLE:
+        logger.warning("ARO_ASYNC is set but aiohttp/aiosmtplib are not installed. Using the sync pipeline.")
+        use_async = False
     
     try:
-        success = monitor.monitor()
-        logger.info(f"Monitoring completed. Success: {success}")
+        monitor = LincolnCommonsMonitor()
+        if use_async:
+            success = asyncio.run(monitor.run_async(poll_interval))
+            logger.info(f"Monitoring completed. Success: {success}")
+        elif poll_interval > 0:
+            monitor.run_forever(poll_interval)
+        else:
+            success = monitor.monitor()
+            logger.info(f"Monitoring completed. Success: {success}")
         
     except KeyboardInterrupt:
         logger.info("Monitoring interrupted by user")
@@ -0,0 +1,270 @@
+"""Regression tests for the ARO monitor's parsing, caching and notification state."""
+
+import json
+import os
+import sys
+import time
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import scraper  # noqa: E402
+
+# Minimal floorplans page: one card in the site-specific markup and one decoy
+# that only the generic class scan would pick up
+FLOORPLANS_HTML = b"""
+<html><body>
+  <div class="floorplan-card" data-floorplan-type="aro-1br">
+    <h3>ARO</h3><p>1 Bed / 1 Bath</p><span>Available now</span>
+  </div>
+  <div class="unit-summary">ARO 1 bed waitlist available soon</div>
+</body></html>
+"""
+
+CARD_XPATH = "//div[@data-floorplan-type='aro-1br']"
+
+
+@pytest.fixture(autouse=True)
+def state_files(monkeypatch, tmp_path):
+    """Keep every test away from the real cache and notification-state files."""
+    monkeypatch.setattr(scraper, 'CACHE_FILE', str(tmp_path / 'cache.json'))
+    monkeypatch.setattr(scraper, 'STATE_FILE', str(tmp_path / 'state.json'))
+    return tmp_path
+
+
+def test_generic_scan_matches_all_listing_containers(monkeypatch):
+    monkeypatch.delenv('ARO_LISTING_XPATH', raising=False)
+    units = scraper.LincolnCommonsMonitor().parse_aro_units(FLOORPLANS_HTML)
+    assert len(units) == 2
+
+
+def test_listing_xpath_selects_only_matching_cards(monkeypatch):
+    monkeypatch.setenv('ARO_LISTING_XPATH', CARD_XPATH)
+    units = scraper.LincolnCommonsMonitor().parse_aro_units(FLOORPLANS_HTML)
+    assert len(units) == 1
+    assert units[0].available
+    assert units[0].text == 'ARO 1 Bed / 1 Bath Available now'
+
+
+def test_listing_xpath_accepts_selenium_page_source(monkeypatch):
+    monkeypatch.setenv('ARO_LISTING_XPATH', CARD_XPATH)
+    page_source = '<?xml version="1.0" encoding="utf-8"?>' + FLOORPLANS_HTML.decode()
+    units = scraper.LincolnCommonsMonitor().parse_aro_units(page_source)
+    assert len(units) == 1
+
+
+@pytest.mark.parametrize('expression', ['//div[', '//div[@class', 'count(//div'])
+def test_listing_xpath_syntax_error_fails_at_startup(monkeypatch, expression):
+    monkeypatch.setenv('ARO_LISTING_XPATH', expression)
+    with pytest.raises(ValueError):
+        scraper.LincolnCommonsMonitor()
+
+
+@pytest.mark.parametrize('expression', [
+    '//div/@class', '//span/@class', '//li/text()', 'count(//div)', 'string(//div)'
+])
+def test_non_element_listing_xpath_is_a_parse_failure(monkeypatch, expression):
+    monkeypatch.setenv('ARO_LISTING_XPATH', expression)
+    monitor = scraper.LincolnCommonsMonitor()
+    page = FLOORPLANS_HTML.replace(b'</body>', b'<span class="x">s</span><ul><li>t</li></ul></body>')
+    assert monitor.parse_aro_units(page) is None
+
+
+# --- Conditional requests (ETag / Last-Modified) ---------------------------
+
+AVAILABLE_HTML = b'<div class="unit">ARO 1 bed available now</div>'
+
+
+class FakeResponse:
+    """Minimal stand-in for a streamed requests.Response."""
+
+    def __init__(self, status_code, body=b'', headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def iter_content(self, chunk_size):
+        yield self.body
+
+
+class FakeGet:
+    """Replays canned responses and records the headers of each request."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def __call__(self, url, headers=None, **kwargs):
+        self.sent_headers.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def notified():
+    """Unit lists passed to the stubbed notifier, one per notification."""
+    return []
+
+
+@pytest.fixture
+def make_monitor(monkeypatch, notified):
+    """Build a monitor with email configured, no Selenium and a stubbed notifier."""
+    monkeypatch.setattr(scraper, 'SELENIUM_AVAILABLE', False)
+    monkeypatch.delenv('ARO_LISTING_XPATH', raising=False)
+    for name in ('EMAIL_ADDRESS', 'EMAIL_PASSWORD', 'NOTIFICATION_EMAIL'):
+        monkeypatch.setenv(name, 'test@example.com')
+
+    def build(*responses, notify_result=True):
+        def notify(self, units):
+            notified.append(units)
+            return notify_result
+        monkeypatch.setattr(scraper.LincolnCommonsMonitor, '_notify_parallel', notify)
+        monitor = scraper.LincolnCommonsMonitor()
+        monitor.session.get = FakeGet(*responses)
+        return monitor
+
+    return build
+
+
+def saved_cache():
+    with open(scraper.CACHE_FILE) as f:
+        return json.load(f)
+
+
+def test_not_modified_skips_parsing(make_monitor, monkeypatch, notified):
+    with open(scraper.CACHE_FILE, 'w') as f:
+        json.dump({'etag': '"v1"', 'last_modified': None}, f)
+    monitor = make_monitor(FakeResponse(304))
+
+    def fail_parse(self, html_content):
+        raise AssertionError("a 304 must not be parsed")
+    monkeypatch.setattr(scraper.LincolnCommonsMonitor, 'parse_aro_units', fail_parse)
+
+    assert monitor.monitor() is False
+    assert monitor.session.get.sent_headers[0]['If-None-Match'] == '"v1"'
+    assert notified == []
+
+
+def test_fetch_returns_not_modified_sentinel_on_304(make_monitor):
+    monitor = make_monitor(FakeResponse(304))
+    assert monitor.fetch_floorplans() is scraper.NOT_MODIFIED
+
+
+def test_failed_parse_leaves_validators_pending(make_monitor, notified):
+    monitor = make_monitor(
+        FakeResponse(200, b'', {'ETag': '"v1"'}),
+        FakeResponse(200, AVAILABLE_HTML, {'ETag': '"v1"'}),
+    )
+    monitor.monitor()
+    assert not os.path.exists(scraper.CACHE_FILE)
+
+    monitor.monitor()
+    assert 'If-None-Match' not in monitor.session.get.sent_headers[1]
+    assert len(notified) == 1
+
+
+def test_failed_notify_leaves_validators_pending(make_monitor, notified):
+    monitor = make_monitor(
+        FakeResponse(200, AVAILABLE_HTML, {'ETag': '"v1"'}),
+        FakeResponse(200, AVAILABLE_HTML, {'ETag': '"v1"'}),
+        notify_result=False,
+    )
+    monitor.monitor()
+    assert not os.path.exists(scraper.CACHE_FILE)
+
+    monitor.monitor()
+    assert 'If-None-Match' not in monitor.session.get.sent_headers[1]
+    assert len(notified) == 2
+
+
+def test_validators_saved_only_after_page_is_handled(make_monitor):
+    monitor = make_monitor(
+        FakeResponse(200, AVAILABLE_HTML, {'ETag': '"v1"', 'Last-Modified': 'Thu, 01 Oct 2026 00:00:00 GMT'}),
+        FakeResponse(304),
+    )
+    assert monitor.fetch_floorplans() == AVAILABLE_HTML
+    assert not os.path.exists(scraper.CACHE_FILE)
+
+    available, units, state_hash = monitor._check_page(AVAILABLE_HTML)
+    assert available and units
+    assert not os.path.exists(scraper.CACHE_FILE)
+
+    monitor._record_notification(state_hash, True)
+    assert saved_cache() == {'etag': '"v1"', 'last_modified': 'Thu, 01 Oct 2026 00:00:00 GMT'}
+
+    assert monitor.monitor() is False
+    assert monitor.session.get.sent_headers[1]['If-None-Match'] == '"v1"'
+
+
+# --- Notification de-duplication and rate limiting ------------------------
+
+OTHER_HTML = b'<div class="unit">ARO 1 bed available now, second floor</div>'
+
+
+def write_state(state_hash, notified_at):
+    with open(scraper.STATE_FILE, 'w') as f:
+        json.dump({'hash': state_hash, 'last_notified_at': notified_at}, f)
+
+
+def saved_state():
+    with open(scraper.STATE_FILE) as f:
+        return json.load(f)
+
+
+def hash_of(monitor, html_content):
+    return monitor._units_hash(monitor.parse_aro_units(html_content))
+
+
+def test_unchanged_units_skip_notification_and_save_cache(make_monitor, notified):
+    monitor = make_monitor(FakeResponse(200, AVAILABLE_HTML, {'ETag': '"v1"'}))
+    write_state(hash_of(monitor, AVAILABLE_HTML), time.time() - 2 * scraper.RENOTIFY_INTERVAL)
+
+    assert monitor.monitor() is True
+    assert notified == []
+    assert saved_cache()['etag'] == '"v1"'
+
+
+def test_changed_units_inside_interval_are_deferred(make_monitor, notified):
+    monitor = make_monitor(
+        FakeResponse(200, OTHER_HTML, {'ETag': '"v2"'}),
+        FakeResponse(200, OTHER_HTML, {'ETag': '"v2"'}),
+    )
+    write_state(hash_of(monitor, AVAILABLE_HTML), time.time())
+
+    assert monitor.monitor() is True
+    assert notified == []
+    assert not os.path.exists(scraper.CACHE_FILE)
+
+    # The deferred page is fetched again in full rather than hidden by a 304
+    monitor.monitor()
+    assert 'If-None-Match' not in monitor.session.get.sent_headers[1]
+
+
+def test_deferred_units_are_sent_once_interval_has_passed(make_monitor, notified):
+    monitor = make_monitor(FakeResponse(200, OTHER_HTML, {'ETag': '"v2"'}))
+    write_state(hash_of(monitor, AVAILABLE_HTML), time.time() - scraper.RENOTIFY_INTERVAL - 1)
+
+    assert monitor.monitor() is True
+    assert len(notified) == 1
+    assert saved_state()['hash'] == hash_of(monitor, OTHER_HTML)
+    assert saved_cache()['etag'] == '"v2"'
+
+
+def test_units_disappearing_clears_hash_but_keeps_last_notified_at(make_monitor, notified):
+    monitor = make_monitor(FakeResponse(200, b'<div class="unit">No ARO units</div>', {'ETag': '"v3"'}))
+    write_state(hash_of(monitor, AVAILABLE_HTML), 1234.5)
+
+    assert monitor.monitor() is False
+    assert saved_state() == {'hash': None, 'last_notified_at': 1234.5}
+    assert saved_cache()['etag'] == '"v3"'